@@ -15,6 +15,23 @@ enum ChatMetadataParser {
     let memoryBlob: String?
   }
 
+  // Compiled once; these run on every assistant reply.
+  private static let looseSuggestionsRegex = try? NSRegularExpression(
+    pattern:
+      "(?ims)(?:^|\\n)\\s*(?:#{1,6}\\s*Suggestions\\s*\\n+|Suggestions:\\s*\\n?)(\\[[\\s\\S]*?\\])(?=\\n\\s*(?:#{1,6}\\s*Memory\\b|Memory:)|\\z)"
+  )
+
+  private static let looseMemoryRegex = try? NSRegularExpression(
+    pattern:
+      "(?ims)(?:^|\\n)\\s*(?:#{1,6}\\s*Memory\\s*\\n+|Memory:\\s*\\n?)(Profile:[\\s\\S]*?Style:[^\\n]*(?:\\n[^#\\n].*)*)(?=\\z)"
+  )
+
+  // Single alternation covering "## Suggestions", "## Memory", "Suggestions:" and
+  // "Memory:" heading lines, so residual headings are stripped in one pass.
+  private static let residualMetadataHeadingRegex = try? NSRegularExpression(
+    pattern: "(?im)^\\s*(?:#{1,6}\\s*(?:Suggestions|Memory)|(?:Suggestions|Memory):)\\s*$"
+  )
+
   static func extractTaggedBlock(from text: String, pattern: String) -> (String, String)? {
     guard let regex = try? NSRegularExpression(pattern: pattern, options: []) else { return nil }
     let range = NSRange(text.startIndex..., in: text)
@@ -36,9 +53,7 @@ enum ChatMetadataParser {
   }
 
   static func extractLooseSuggestions(from text: String) -> (String, String)? {
-    let pattern =
-      "(?ims)(?:^|\\n)\\s*(?:#{1,6}\\s*Suggestions\\s*\\n+|Suggestions:\\s*\\n?)(\\[[\\s\\S]*?\\])(?=\\n\\s*(?:#{1,6}\\s*Memory\\b|Memory:)|\\z)"
-    guard let regex = try? NSRegularExpression(pattern: pattern, options: []) else { return nil }
+    guard let regex = looseSuggestionsRegex else { return nil }
     let range = NSRange(text.startIndex..., in: text)
     guard
       let match = regex.firstMatch(in: text, options: [], range: range),
@@ -58,9 +73,7 @@ enum ChatMetadataParser {
   }
 
   static func extractLooseMemory(from text: String) -> (String, String)? {
-    let pattern =
-      "(?ims)(?:^|\\n)\\s*(?:#{1,6}\\s*Memory\\s*\\n+|Memory:\\s*\\n?)(Profile:[\\s\\S]*?Style:[^\\n]*(?:\\n[^#\\n].*)*)(?=\\z)"
-    guard let regex = try? NSRegularExpression(pattern: pattern, options: []) else { return nil }
+    guard let regex = looseMemoryRegex else { return nil }
     let range = NSRange(text.startIndex..., in: text)
     guard
       let match = regex.firstMatch(in: text, options: [], range: range),
@@ -80,25 +93,14 @@ enum ChatMetadataParser {
   }
 
   static func stripResidualMetadataHeadings(from text: String) -> String {
-    let patterns = [
-      "(?im)^\\s*#{1,6}\\s*Suggestions\\s*$",
-      "(?im)^\\s*#{1,6}\\s*Memory\\s*$",
-      "(?im)^\\s*Suggestions:\\s*$",
-      "(?im)^\\s*Memory:\\s*$",
-    ]
-
-    return patterns.reduce(text) { partial, pattern in
-      guard let regex = try? NSRegularExpression(pattern: pattern, options: []) else {
-        return partial
-      }
-      let range = NSRange(partial.startIndex..., in: partial)
-      return regex.stringByReplacingMatches(
-        in: partial,
-        options: [],
-        range: range,
-        withTemplate: ""
-      )
-    }
+    guard let regex = residualMetadataHeadingRegex else { return text }
+    let range = NSRange(text.startIndex..., in: text)
+    return regex.stringByReplacingMatches(
+      in: text,
+      options: [],
+      range: range,
+      withTemplate: ""
+    )
   }
 
   static func normalizeAutoMemoryBlob(_ raw: String) -> String? {
@@ -11,6 +11,8 @@ final class DailyRecapScheduler: @unchecked Sendable {
   private let queue = DispatchQueue(label: "com.dayflow.dailyRecapScheduler", qos: .utility)
   private var timer: DispatchSourceTimer?
   private var isRunningCheck = false
+  // Timeline day whose standup already exists; interval checks skip the DB until it rolls over.
+  private var lastSatisfiedDay: String?
 
   private let checkInterval: TimeInterval = 5 * 60
   private let sourceLookbackWindowDays = 3
@@ -55,6 +57,9 @@ final class DailyRecapScheduler: @unchecked Sendable {
     guard !isRunningCheck else {
       return
     }
+    guard lastSatisfiedDay != Date().getDayInfoFor4AMBoundary().dayString else {
+      return
+    }
 
     isRunningCheck = true
     Task.detached(priority: .utility) { [weak self] in
@@ -84,6 +89,9 @@ final class DailyRecapScheduler: @unchecked Sendable {
     let targetDay = currentDay.dayString
 
     guard StorageManager.shared.fetchDailyStandup(forDay: targetDay) == nil else {
+      queue.async { [weak self] in
+        self?.lastSatisfiedDay = targetDay
+      }
       return
     }
 
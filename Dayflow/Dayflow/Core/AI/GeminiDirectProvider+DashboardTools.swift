@@ -129,28 +129,23 @@ extension GeminiDirectProvider {
     let requestedLimit = positiveIntArg(args["limit"])
     let dateRange = try parseDashboardDateRange(args: args)
 
-    let observations: [Observation]
+    // The limit is applied in SQL so long ranges don't load rows we'd drop.
+    let effectiveObservations: [Observation]
     if dateRange.mode == "date", let date = dateRange.date {
       let dayBounds = try dashboardDayBounds(for: date)
-      observations = StorageManager.shared.fetchObservationsByTimeRange(
+      effectiveObservations = StorageManager.shared.fetchObservationsByTimeRange(
         from: dayBounds.start,
-        to: dayBounds.end
+        to: dayBounds.end,
+        limit: requestedLimit
       )
     } else {
-      observations = StorageManager.shared.fetchObservationsByTimeRange(
+      effectiveObservations = StorageManager.shared.fetchObservationsByTimeRange(
         from: dateRange.from,
-        to: dateRange.to
+        to: dateRange.to,
+        limit: requestedLimit
       )
     }
 
-    let limitedObservations: [Observation]
-    if let requestedLimit {
-      limitedObservations = Array(observations.prefix(requestedLimit))
-    } else {
-      limitedObservations = observations
-    }
-
-    let effectiveObservations = limitedObservations
     let items = dashboardObservationDayGroups(from: effectiveObservations)
 
     let itemCount = effectiveObservations.count
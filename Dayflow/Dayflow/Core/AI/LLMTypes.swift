@@ -162,7 +162,7 @@ struct BatchingConfig {
   )
 }
 
-struct AppSites: Codable {
+struct AppSites: Codable, Equatable {
   let primary: String?
   let secondary: String?
 }
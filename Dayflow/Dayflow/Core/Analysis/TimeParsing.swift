@@ -22,6 +22,10 @@ private let cachedHMMAFormatters: [DateFormatter] = {
 func parseTimeHMMA(timeString: String) -> Int? {
   let trimmedTime = timeString.trimmingCharacters(in: .whitespacesAndNewlines).uppercased()
 
+  if let minutes = parseCanonicalHMMA(trimmedTime) {
+    return minutes
+  }
+
   for formatter in cachedHMMAFormatters {
     if let date = formatter.date(from: trimmedTime) {
       let calendar = Calendar.current
@@ -33,3 +37,50 @@ func parseTimeHMMA(timeString: String) -> Int? {
 
   return nil
 }
+
+/// Fast path for well-formed "h:mm a" / "hh:mma" strings (already trimmed and uppercased).
+/// Card timestamps are parsed on every summary/timeline pass, so this skips ICU for the
+/// common case. Anything it doesn't strictly recognize returns nil and falls back to the
+/// DateFormatters above, which keeps their lenient behavior for odd inputs.
+private func parseCanonicalHMMA(_ time: String) -> Int? {
+  let bytes = Array(time.utf8)
+  var index = 0
+
+  func readDigits(maxCount: Int) -> (value: Int, count: Int) {
+    var value = 0
+    var count = 0
+    while index < bytes.count, count < maxCount, bytes[index] >= 48, bytes[index] <= 57 {
+      value = value * 10 + Int(bytes[index] - 48)
+      index += 1
+      count += 1
+    }
+    return (value, count)
+  }
+
+  let hour = readDigits(maxCount: 2)
+  guard hour.count > 0, (1...12).contains(hour.value),
+    index < bytes.count, bytes[index] == UInt8(ascii: ":")
+  else {
+    return nil
+  }
+  index += 1
+
+  let minute = readDigits(maxCount: 2)
+  guard minute.count == 2, minute.value < 60 else { return nil }
+
+  if index < bytes.count, bytes[index] == UInt8(ascii: " ") {
+    index += 1
+  }
+  guard bytes.count - index == 2, bytes[index + 1] == UInt8(ascii: "M") else { return nil }
+
+  let hour24: Int
+  switch bytes[index] {
+  case UInt8(ascii: "A"):
+    hour24 = hour.value % 12
+  case UInt8(ascii: "P"):
+    hour24 = hour.value % 12 + 12
+  default:
+    return nil
+  }
+  return hour24 * 60 + minute.value
+}
@@ -107,7 +107,18 @@ enum RecordingPrivacyPreferences {
     applicationName: String?,
     defaults: UserDefaults = .standard
   ) -> Bool {
-    let blocked = Set(blockedApplicationIdentifiers(defaults: defaults))
+    isApplicationBlocked(
+      bundleIdentifier: bundleIdentifier,
+      applicationName: applicationName,
+      blocked: Set(blockedApplicationIdentifiers(defaults: defaults))
+    )
+  }
+
+  private static func isApplicationBlocked(
+    bundleIdentifier: String?,
+    applicationName: String?,
+    blocked: Set<String>
+  ) -> Bool {
     guard !blocked.isEmpty else { return false }
 
     let candidates = [
@@ -143,11 +154,15 @@ enum RecordingPrivacyPreferences {
     in content: SCShareableContent,
     defaults: UserDefaults = .standard
   ) -> [SCRunningApplication] {
-    content.applications.filter { app in
+    // Runs on every capture: load and normalize the block list once, not per running app.
+    let blocked = Set(blockedApplicationIdentifiers(defaults: defaults))
+    guard !blocked.isEmpty else { return [] }
+
+    return content.applications.filter { app in
       isApplicationBlocked(
         bundleIdentifier: app.bundleIdentifier,
         applicationName: app.applicationName,
-        defaults: defaults
+        blocked: blocked
       )
     }
   }
@@ -14,6 +14,13 @@ extension DateFormatter {
     formatter.timeZone = Calendar.current.timeZone
     return formatter
   }()
+
+  /// Used to name capture files; shared so each capture doesn't build a new formatter.
+  static let fileTimestamp: DateFormatter = {
+    let formatter = DateFormatter()
+    formatter.dateFormat = "yyyyMMdd_HHmmssSSS"
+    return formatter
+  }()
 }
 
 extension Date {
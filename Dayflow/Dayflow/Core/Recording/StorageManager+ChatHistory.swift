@@ -42,12 +42,14 @@ extension StorageManager {
         sql: "DELETE FROM chat_messages WHERE conversation_id = ?",
         arguments: [record.id.uuidString])
 
+      // The full message list is rewritten on every save; compile the INSERT once
+      let insertMessage = try db.cachedStatement(
+        sql: """
+              INSERT INTO chat_messages (id, conversation_id, role, content, created_at, sort_order)
+              VALUES (?, ?, ?, ?, ?, ?)
+          """)
       for (index, message) in messages.enumerated() {
-        try db.execute(
-          sql: """
-                INSERT INTO chat_messages (id, conversation_id, role, content, created_at, sort_order)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """,
+        try insertMessage.execute(
           arguments: [
             message.id.uuidString,
             record.id.uuidString,
@@ -4,9 +4,8 @@ import Sentry
 
 extension StorageManager {
   func nextFileURL() -> URL {
-    let df = DateFormatter()
-    df.dateFormat = "yyyyMMdd_HHmmssSSS"
-    return root.appendingPathComponent("\(df.string(from: Date())).mp4")
+    let name = DateFormatter.fileTimestamp.string(from: Date())
+    return root.appendingPathComponent("\(name).mp4")
   }
 
   func registerChunk(url: URL) {
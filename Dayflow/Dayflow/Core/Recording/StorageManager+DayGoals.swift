@@ -175,14 +175,16 @@ extension StorageManager {
     day: String,
     db: Database
   ) throws {
+    guard !categories.isEmpty else { return }
+    let statement = try db.cachedStatement(
+      sql: """
+            INSERT INTO day_goal_categories(
+                day, kind, category_id, category_name, category_color_hex, sort_order
+            )
+            VALUES (?, ?, ?, ?, ?, ?)
+        """)
     for (index, category) in categories.enumerated() {
-      try db.execute(
-        sql: """
-              INSERT INTO day_goal_categories(
-                  day, kind, category_id, category_name, category_color_hex, sort_order
-              )
-              VALUES (?, ?, ?, ?, ?, ?)
-          """,
+      try statement.execute(
         arguments: [
           day,
           kind.rawValue,
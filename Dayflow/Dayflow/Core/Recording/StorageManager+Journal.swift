@@ -62,73 +62,47 @@ extension StorageManager {
   /// Update just the intentions/notes/goals fields (morning form)
   func updateJournalIntentions(day: String, intentions: String?, notes: String?, goals: String?) {
     try? timedWrite("updateJournalIntentions") { db in
-      // Check if entry exists
-      let exists =
-        try Int.fetchOne(
-          db, sql: "SELECT COUNT(*) FROM journal_entries WHERE day = ?", arguments: [day]) ?? 0
-
-      if exists > 0 {
-        try db.execute(
-          sql: """
-                UPDATE journal_entries
-                SET intentions = ?, notes = ?, goals = ?, status = 'intentions_set', updated_at = CURRENT_TIMESTAMP
-                WHERE day = ?
-            """, arguments: [intentions, notes, goals, day])
-      } else {
-        try db.execute(
-          sql: """
-                INSERT INTO journal_entries (day, intentions, notes, goals, status)
-                VALUES (?, ?, ?, ?, 'intentions_set')
-            """, arguments: [day, intentions, notes, goals])
-      }
+      try db.execute(
+        sql: """
+              INSERT INTO journal_entries (day, intentions, notes, goals, status)
+              VALUES (?, ?, ?, ?, 'intentions_set')
+              ON CONFLICT(day) DO UPDATE SET
+                  intentions = excluded.intentions,
+                  notes = excluded.notes,
+                  goals = excluded.goals,
+                  status = 'intentions_set',
+                  updated_at = CURRENT_TIMESTAMP
+          """, arguments: [day, intentions, notes, goals])
     }
   }
 
   /// Update just the reflections field (evening reflection)
   func updateJournalReflections(day: String, reflections: String?) {
     try? timedWrite("updateJournalReflections") { db in
-      let exists =
-        try Int.fetchOne(
-          db, sql: "SELECT COUNT(*) FROM journal_entries WHERE day = ?", arguments: [day]) ?? 0
-
-      if exists > 0 {
-        try db.execute(
-          sql: """
-                UPDATE journal_entries
-                SET reflections = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE day = ?
-            """, arguments: [reflections, day])
-      } else {
-        try db.execute(
-          sql: """
-                INSERT INTO journal_entries (day, reflections, status)
-                VALUES (?, ?, 'draft')
-            """, arguments: [day, reflections])
-      }
+      // Existing entries keep their status; new ones start as a draft
+      try db.execute(
+        sql: """
+              INSERT INTO journal_entries (day, reflections, status)
+              VALUES (?, ?, 'draft')
+              ON CONFLICT(day) DO UPDATE SET
+                  reflections = excluded.reflections,
+                  updated_at = CURRENT_TIMESTAMP
+          """, arguments: [day, reflections])
     }
   }
 
   /// Update just the AI summary field
   func updateJournalSummary(day: String, summary: String?) {
     try? timedWrite("updateJournalSummary") { db in
-      let exists =
-        try Int.fetchOne(
-          db, sql: "SELECT COUNT(*) FROM journal_entries WHERE day = ?", arguments: [day]) ?? 0
-
-      if exists > 0 {
-        try db.execute(
-          sql: """
-                UPDATE journal_entries
-                SET summary = ?, status = 'complete', updated_at = CURRENT_TIMESTAMP
-                WHERE day = ?
-            """, arguments: [summary, day])
-      } else {
-        try db.execute(
-          sql: """
-                INSERT INTO journal_entries (day, summary, status)
-                VALUES (?, ?, 'complete')
-            """, arguments: [day, summary])
-      }
+      try db.execute(
+        sql: """
+              INSERT INTO journal_entries (day, summary, status)
+              VALUES (?, ?, 'complete')
+              ON CONFLICT(day) DO UPDATE SET
+                  summary = excluded.summary,
+                  status = 'complete',
+                  updated_at = CURRENT_TIMESTAMP
+          """, arguments: [day, summary])
     }
   }
 
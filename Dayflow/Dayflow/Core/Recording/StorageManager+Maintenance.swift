@@ -393,6 +393,7 @@ extension StorageManager {
         while currentSize - freedSpace > limit {
           var deletedThisPass = 0
           var freedThisPass: Int64 = 0
+          var victims: [(id: Int64, path: String, storedSize: Int64?)] = []
 
           try timedWrite("purgeScreenshots") { db in
             // Get oldest active screenshots
@@ -406,44 +407,48 @@ extension StorageManager {
                     LIMIT 500
                 """)
 
-            guard !oldScreenshots.isEmpty else { return }
-
-            for screenshot in oldScreenshots {
-              guard let id: Int64 = screenshot["id"],
-                let path: String = screenshot["file_path"]
-              else { continue }
-
-              // Mark as deleted in DB first (safer ordering)
-              try db.execute(
-                sql: """
-                      UPDATE screenshots
-                      SET is_deleted = 1
-                      WHERE id = ?
-                  """, arguments: [id])
-
-              // Then delete physical file
-              if fileMgr.fileExists(atPath: path) {
-                var fileSize: Int64 = 0
-                if let storedSize: Int64 = screenshot["file_size"] {
-                  fileSize = storedSize
-                }
-                if fileSize == 0,
-                  let attrs = try? fileMgr.attributesOfItem(atPath: path),
-                  let size = attrs[.size] as? NSNumber
-                {
-                  fileSize = size.int64Value
-                }
-
-                do {
-                  try fileMgr.removeItem(atPath: path)
-                  freedThisPass += fileSize
-                  deletedThisPass += 1
-                } catch {
-                  print("⚠️ Failed to delete screenshot at \(path): \(error)")
-                }
-              } else {
+            victims = oldScreenshots.compactMap { row in
+              guard let id: Int64 = row["id"], let path: String = row["file_path"] else {
+                return nil
+              }
+              let storedSize: Int64? = row["file_size"]
+              return (id, path, storedSize)
+            }
+
+            guard !victims.isEmpty else { return }
+
+            // Mark the whole pass as deleted in DB first (safer ordering), in one statement
+            let placeholders = Array(repeating: "?", count: victims.count).joined(separator: ",")
+            try db.execute(
+              sql: """
+                    UPDATE screenshots
+                    SET is_deleted = 1
+                    WHERE id IN (\(placeholders))
+                """, arguments: StatementArguments(victims.map { $0.id }))
+          }
+
+          // Then delete physical files, outside the write transaction so captures aren't blocked
+          for victim in victims {
+            let path = victim.path
+
+            if fileMgr.fileExists(atPath: path) {
+              var fileSize = victim.storedSize ?? 0
+              if fileSize == 0,
+                let attrs = try? fileMgr.attributesOfItem(atPath: path),
+                let size = attrs[.size] as? NSNumber
+              {
+                fileSize = size.int64Value
+              }
+
+              do {
+                try fileMgr.removeItem(atPath: path)
+                freedThisPass += fileSize
                 deletedThisPass += 1
+              } catch {
+                print("⚠️ Failed to delete screenshot at \(path): \(error)")
               }
+            } else {
+              deletedThisPass += 1
             }
           }
 
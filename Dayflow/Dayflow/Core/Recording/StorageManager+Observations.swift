@@ -6,14 +6,15 @@ extension StorageManager {
   func saveObservations(batchId: Int64, observations: [Observation]) {
     guard !observations.isEmpty else { return }
     try? timedWrite("saveObservations(\(observations.count)_items)") { db in
+      let statement = try db.cachedStatement(
+        sql: """
+              INSERT INTO observations(
+                  batch_id, start_ts, end_ts, observation, metadata, llm_model
+              )
+              VALUES (?, ?, ?, ?, ?, ?)
+          """)
       for obs in observations {
-        try db.execute(
-          sql: """
-                INSERT INTO observations(
-                    batch_id, start_ts, end_ts, observation, metadata, llm_model
-                )
-                VALUES (?, ?, ?, ?, ?, ?)
-            """,
+        try statement.execute(
           arguments: [
             batchId, obs.startTs, obs.endTs, obs.observation,
             obs.metadata, obs.llmModel,
@@ -47,6 +48,12 @@ extension StorageManager {
   }
 
   func fetchObservationsByTimeRange(from: Date, to: Date) -> [Observation] {
+    fetchObservationsByTimeRange(from: from, to: to, limit: nil)
+  }
+
+  /// Same as `fetchObservationsByTimeRange(from:to:)`, but stops at `limit` rows in SQL
+  /// so capped callers don't materialize observations they'd immediately drop.
+  func fetchObservationsByTimeRange(from: Date, to: Date, limit: Int?) -> [Observation] {
     let fromTs = Int(from.timeIntervalSince1970)
     let toTs = Int(to.timeIntervalSince1970)
 
@@ -59,7 +66,8 @@ extension StorageManager {
                 WHERE (start_ts < ? AND end_ts > ?) 
                    OR (start_ts >= ? AND start_ts < ?)
                 ORDER BY start_ts ASC
-            """, arguments: [toTs, fromTs, fromTs, toTs]
+                LIMIT ?
+            """, arguments: [toTs, fromTs, fromTs, toTs, limit ?? -1]
         ).map { row in
           Observation(
             id: row["id"],
@@ -6,9 +6,8 @@ extension StorageManager {
   // MARK: - Screenshot Management (new - replaces video chunks)
 
   func nextScreenshotURL() -> URL {
-    let df = DateFormatter()
-    df.dateFormat = "yyyyMMdd_HHmmssSSS"
-    return root.appendingPathComponent("\(df.string(from: Date())).jpg")
+    let name = DateFormatter.fileTimestamp.string(from: Date())
+    return root.appendingPathComponent("\(name).jpg")
   }
 
   func saveScreenshot(url: URL, capturedAt: Date, idleSecondsAtCapture: Int?) -> Int64? {
@@ -25,11 +24,13 @@ extension StorageManager {
 
     var screenshotId: Int64?
     try? timedWrite("saveScreenshot") { db in
-      try db.execute(
+      // Runs on every capture, so keep the compiled INSERT in GRDB's statement cache
+      let statement = try db.cachedStatement(
         sql: """
               INSERT INTO screenshots(captured_at, file_path, file_size, idle_seconds_at_capture)
               VALUES (?, ?, ?, ?)
-          """, arguments: [timestamp, path, fileSize, idleSecondsAtCapture])
+          """)
+      try statement.execute(arguments: [timestamp, path, fileSize, idleSecondsAtCapture])
       screenshotId = db.lastInsertedRowID
     }
     return screenshotId
@@ -74,12 +75,13 @@ extension StorageManager {
           """, arguments: [startTs, endTs])
       batchId = db.lastInsertedRowID
 
+      let linkStatement = try db.cachedStatement(
+        sql: """
+              INSERT INTO batch_screenshots(batch_id, screenshot_id)
+              VALUES (?, ?)
+          """)
       for id in screenshotIds {
-        try db.execute(
-          sql: """
-                INSERT INTO batch_screenshots(batch_id, screenshot_id)
-                VALUES (?, ?)
-            """, arguments: [batchId, id])
+        try linkStatement.execute(arguments: [batchId, id])
       }
     }
     return batchId == 0 ? nil : batchId
@@ -411,10 +411,83 @@ extension StorageManager {
   func fetchTimelineCards(forDay day: String) -> [TimelineCard] {
     let decoder = JSONDecoder()
 
-    guard let dayDate = dateFormatter.date(from: day) else {
+    guard let window = timelineDayWindow(forDay: day) else {
       return []
     }
 
+    let cards: [TimelineCard]? = try? timedRead("fetchTimelineCards(forDay:\(day))") { db in
+      try Row.fetchAll(
+        db,
+        sql: """
+              SELECT * FROM timeline_cards
+              WHERE start_ts >= ? AND start_ts < ?
+                AND is_deleted = 0
+              ORDER BY start_ts ASC, start ASC
+          """, arguments: [window.startTs, window.endTs]
+      )
+      .map { row in timelineCard(from: row, decoder: decoder) }
+    }
+    return cards ?? []
+  }
+
+  /// Multi-day variant of `fetchTimelineCards(forDay:)` for range reads such as exports.
+  /// Issues one query over the whole span and buckets rows back into the same 4 AM day
+  /// windows, instead of one round-trip per day. Every requested day gets an entry.
+  func fetchTimelineCards(forDays days: [String]) -> [String: [TimelineCard]] {
+    let windows = days.compactMap { day -> (day: String, startTs: Int, endTs: Int)? in
+      guard let window = timelineDayWindow(forDay: day) else { return nil }
+      return (day, window.startTs, window.endTs)
+    }
+    .sorted { $0.startTs < $1.startTs }
+    guard let rangeStart = windows.first?.startTs,
+      let rangeEnd = windows.map({ $0.endTs }).max()
+    else {
+      return [:]
+    }
+
+    var emptyDays: [String: [TimelineCard]] = [:]
+    for window in windows {
+      emptyDays[window.day] = []
+    }
+
+    let decoder = JSONDecoder()
+    let cardsByDay = try? timedRead("fetchTimelineCards(forDays:\(days.count))") { db in
+      let rows = try Row.fetchCursor(
+        db,
+        sql: """
+              SELECT * FROM timeline_cards
+              WHERE start_ts >= ? AND start_ts < ?
+                AND is_deleted = 0
+              ORDER BY start_ts ASC, start ASC
+          """, arguments: [rangeStart, rangeEnd]
+      )
+
+      // Rows arrive ordered by start_ts and the windows are sorted, so one merge walk
+      // buckets them. Decoding straight off the cursor keeps a single copy of the range.
+      var buckets = emptyDays
+      var windowIndex = 0
+      while let row = try rows.next() {
+        let startTs: Int = row["start_ts"] ?? 0
+        while windowIndex < windows.count, startTs >= windows[windowIndex].endTs {
+          windowIndex += 1
+        }
+        guard windowIndex < windows.count else { break }
+        let window = windows[windowIndex]
+        guard startTs >= window.startTs else { continue }
+        buckets[window.day, default: []].append(timelineCard(from: row, decoder: decoder))
+      }
+      return buckets
+    }
+    return cardsByDay ?? emptyDays
+  }
+
+  /// 4 AM -> 4 AM timestamp window for a "yyyy-MM-dd" day string.
+  private func timelineDayWindow(forDay day: String) -> (startTs: Int, endTs: Int)? {
+    // Shared formatter: multi-day exports call this once per day in the range
+    guard let dayDate = DateFormatter.yyyyMMdd.date(from: day) else {
+      return nil
+    }
+
     let calendar = Calendar.current
 
     // Get 4 AM of the given day as the start
@@ -422,67 +495,54 @@ extension StorageManager {
     startComponents.hour = 4
     startComponents.minute = 0
     startComponents.second = 0
-    guard let dayStart = calendar.date(from: startComponents) else { return [] }
+    guard let dayStart = calendar.date(from: startComponents) else { return nil }
 
     // Get 4 AM of the next day as the end
-    guard let nextDay = calendar.date(byAdding: .day, value: 1, to: dayDate) else { return [] }
+    guard let nextDay = calendar.date(byAdding: .day, value: 1, to: dayDate) else { return nil }
     var endComponents = calendar.dateComponents([.year, .month, .day], from: nextDay)
     endComponents.hour = 4
     endComponents.minute = 0
     endComponents.second = 0
-    guard let dayEnd = calendar.date(from: endComponents) else { return [] }
+    guard let dayEnd = calendar.date(from: endComponents) else { return nil }
 
-    let startTs = Int(dayStart.timeIntervalSince1970)
-    let endTs = Int(dayEnd.timeIntervalSince1970)
-
-    let cards: [TimelineCard]? = try? timedRead("fetchTimelineCards(forDay:\(day))") { db in
-      try Row.fetchAll(
-        db,
-        sql: """
-              SELECT * FROM timeline_cards
-              WHERE start_ts >= ? AND start_ts < ?
-                AND is_deleted = 0
-              ORDER BY start_ts ASC, start ASC
-          """, arguments: [startTs, endTs]
-      )
-      .map { row in
-        // Decode metadata JSON (supports object or legacy array)
-        var distractions: [Distraction]? = nil
-        var appSites: AppSites? = nil
-        var isBackupGenerated: Bool? = nil
-        if let metadataString: String = row["metadata"],
-          let jsonData = metadataString.data(using: .utf8)
-        {
-          if let meta = try? decoder.decode(TimelineMetadata.self, from: jsonData) {
-            distractions = meta.distractions
-            appSites = meta.appSites
-            isBackupGenerated = meta.isBackupGenerated
-          } else if let legacy = try? decoder.decode([Distraction].self, from: jsonData) {
-            distractions = legacy
-          }
-        }
+    return (Int(dayStart.timeIntervalSince1970), Int(dayEnd.timeIntervalSince1970))
+  }
 
-        // Create TimelineCard instance using renamed columns
-        return TimelineCard(
-          recordId: row["id"],
-          batchId: row["batch_id"],
-          startTimestamp: row["start"] ?? "",  // Use row["start"]
-          endTimestamp: row["end"] ?? "",  // Use row["end"]
-          category: row["category"],
-          subcategory: row["subcategory"],
-          title: row["title"],
-          summary: row["summary"],
-          detailedSummary: row["detailed_summary"],
-          day: row["day"],
-          distractions: distractions,
-          videoSummaryURL: row["video_summary_url"],
-          otherVideoSummaryURLs: nil,
-          appSites: appSites,
-          isBackupGenerated: isBackupGenerated
-        )
+  private func timelineCard(from row: Row, decoder: JSONDecoder) -> TimelineCard {
+    // Decode metadata JSON (supports object or legacy array)
+    var distractions: [Distraction]? = nil
+    var appSites: AppSites? = nil
+    var isBackupGenerated: Bool? = nil
+    if let metadataString: String = row["metadata"],
+      let jsonData = metadataString.data(using: .utf8)
+    {
+      if let meta = try? decoder.decode(TimelineMetadata.self, from: jsonData) {
+        distractions = meta.distractions
+        appSites = meta.appSites
+        isBackupGenerated = meta.isBackupGenerated
+      } else if let legacy = try? decoder.decode([Distraction].self, from: jsonData) {
+        distractions = legacy
       }
     }
-    return cards ?? []
+
+    // Create TimelineCard instance using renamed columns
+    return TimelineCard(
+      recordId: row["id"],
+      batchId: row["batch_id"],
+      startTimestamp: row["start"] ?? "",  // Use row["start"]
+      endTimestamp: row["end"] ?? "",  // Use row["end"]
+      category: row["category"],
+      subcategory: row["subcategory"],
+      title: row["title"],
+      summary: row["summary"],
+      detailedSummary: row["detailed_summary"],
+      day: row["day"],
+      distractions: distractions,
+      videoSummaryURL: row["video_summary_url"],
+      otherVideoSummaryURLs: nil,
+      appSites: appSites,
+      isBackupGenerated: isBackupGenerated
+    )
   }
 
   func fetchTimelineCardsByTimeRange(from: Date, to: Date) -> [TimelineCard] {
@@ -831,21 +891,6 @@ extension StorageManager {
 
       videoPaths = videoRows.compactMap { $0["video_summary_url"] as? String }
 
-      // Fetch the cards that will be deleted for debugging
-      let cardsToDelete = try Row.fetchAll(
-        db,
-        sql: """
-              SELECT id, start, end, title FROM timeline_cards
-              WHERE ((start_ts < ? AND end_ts > ?)
-                 OR (start_ts >= ? AND start_ts < ?))
-                 AND is_deleted = 0
-                 AND (category != 'System' OR batch_id = ?)
-          """, arguments: [toTs, fromTs, fromTs, toTs, batchId])
-
-      for _ in cardsToDelete {
-        // Cards being deleted - no-op needed, just iterating to trigger side effects
-      }
-
       // Soft delete existing cards in the range using timestamp columns
       // Preserve error cards (category='System') from other batches so they remain visible
       try db.execute(
@@ -858,22 +903,35 @@ extension StorageManager {
                  AND (category != 'System' OR batch_id = ?)
           """, arguments: [toTs, fromTs, fromTs, toTs, batchId])
 
-      // Verify soft deletion (count remaining active cards)
-      let remainingCount =
-        try Int.fetchOne(
-          db,
-          sql: """
-                SELECT COUNT(*) FROM timeline_cards
-                WHERE ((start_ts < ? AND end_ts > ?)
-                   OR (start_ts >= ? AND start_ts < ?))
-                   AND is_deleted = 0
-            """, arguments: [toTs, fromTs, fromTs, toTs]) ?? 0
+      // Insert new cards through GRDB's statement cache (compiled once, reused across batches)
+      let insertStatement = try db.cachedStatement(
+        sql: """
+              INSERT INTO timeline_cards(
+                  batch_id, start, end, start_ts, end_ts, day, title,
+                  summary, category, subcategory, detailed_summary, metadata
+              )
+              VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+          """)
 
-      if remainingCount > 0 {
-      } else {
+      // Resolve clock-only timestamps by picking the nearest day to the window midpoint
+      let calendar = Calendar.current
+      let anchor = from.addingTimeInterval(to.timeIntervalSince(from) / 2.0)
+
+      let resolveClock: (Int, Int) -> Date = { hour, minute in
+        guard
+          let sameDay = calendar.date(bySettingHour: hour, minute: minute, second: 0, of: anchor)
+        else {
+          return anchor
+        }
+        let previousDay = calendar.date(byAdding: .day, value: -1, to: sameDay) ?? sameDay
+        let nextDay = calendar.date(byAdding: .day, value: 1, to: sameDay) ?? sameDay
+
+        let candidates = [previousDay, sameDay, nextDay]
+        return candidates.min { lhs, rhs in
+          abs(lhs.timeIntervalSince(anchor)) < abs(rhs.timeIntervalSince(anchor))
+        } ?? sameDay
       }
 
-      // Insert new cards
       for card in newCards {
         // Encode metadata object with distractions and appSites
         let meta = TimelineMetadata(
@@ -886,25 +944,6 @@ extension StorageManager {
           String(data: $0, encoding: .utf8)
         }
 
-        // Resolve clock-only timestamps by picking the nearest day to the window midpoint
-        let calendar = Calendar.current
-        let anchor = from.addingTimeInterval(to.timeIntervalSince(from) / 2.0)
-
-        let resolveClock: (Int, Int) -> Date = { hour, minute in
-          guard
-            let sameDay = calendar.date(bySettingHour: hour, minute: minute, second: 0, of: anchor)
-          else {
-            return anchor
-          }
-          let previousDay = calendar.date(byAdding: .day, value: -1, to: sameDay) ?? sameDay
-          let nextDay = calendar.date(byAdding: .day, value: 1, to: sameDay) ?? sameDay
-
-          let candidates = [previousDay, sameDay, nextDay]
-          return candidates.min { lhs, rhs in
-            abs(lhs.timeIntervalSince(anchor)) < abs(rhs.timeIntervalSince(anchor))
-          } ?? sameDay
-        }
-
         guard let startTime = timeFormatter.date(from: card.startTimestamp),
           let endTime = timeFormatter.date(from: card.endTimestamp)
         else {
@@ -937,14 +976,7 @@ extension StorageManager {
         // Calculate the day string using 4 AM boundary rules
         let (dayString, _, _) = startDate.getDayInfoFor4AMBoundary()
 
-        try db.execute(
-          sql: """
-                INSERT INTO timeline_cards(
-                    batch_id, start, end, start_ts, end_ts, day, title,
-                    summary, category, subcategory, detailed_summary, metadata
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+        try insertStatement.execute(
           arguments: [
             batchId, card.startTimestamp, card.endTimestamp, startTs, endTs, dayString, card.title,
             card.summary, card.category, card.subcategory, card.detailedSummary, metadataString,
@@ -228,8 +228,12 @@ final class StorageManager: StorageManaging, @unchecked Sendable {
       if !db.configuration.readonly {
         try db.execute(sql: "PRAGMA journal_mode = WAL")
         try db.execute(sql: "PRAGMA synchronous = NORMAL")
+        // Larger page cache (~16 MB) on the single writer only; readers keep the ~2 MB default
+        try db.execute(sql: "PRAGMA cache_size = -16000")
       }
       try db.execute(sql: "PRAGMA busy_timeout = 5000")
+      // In-memory temp b-trees for sorts
+      try db.execute(sql: "PRAGMA temp_store = MEMORY")
     }
 
     // Safe database initialization with automatic recovery from backup
@@ -551,6 +555,9 @@ final class StorageManager: StorageManaging, @unchecked Sendable {
                   created_at DATETIME DEFAULT CURRENT_TIMESTAMP
               );
               CREATE INDEX IF NOT EXISTS idx_screenshots_captured_at ON screenshots(captured_at);
+              -- Purged rows stay in the table as is_deleted = 1; keep active scans off them
+              CREATE INDEX IF NOT EXISTS idx_screenshots_active_captured_at
+                  ON screenshots(captured_at) WHERE is_deleted = 0;
 
               -- Junction table linking batches to screenshots
               CREATE TABLE IF NOT EXISTS batch_screenshots (
@@ -29,7 +29,7 @@ private struct TimelineCardsLayerFramePreferenceKey: PreferenceKey {
 }
 
 // Positioned activity for Canvas rendering
-private struct CanvasPositionedActivity: Identifiable {
+private struct CanvasPositionedActivity: Identifiable, Equatable {
   let id: String
   let activity: TimelineActivity
   let yPosition: CGFloat
@@ -312,6 +312,7 @@ struct CanvasTimelineDataView: View {
 
   private var cardsLayer: some View {
     GeometryReader { geo in
+      let categoryStyles = categoryStyleLookup()
       ZStack(alignment: .topLeading) {
         Color.clear
           .contentShape(Rectangle())
@@ -326,7 +327,7 @@ struct CanvasTimelineDataView: View {
             time: item.timeLabel,
             height: item.height,
             durationMinutes: item.durationMinutes,
-            style: style(for: item.categoryName),
+            style: style(for: item.categoryName, in: categoryStyles),
             isSelected: selectedCardId == item.id,
             isSystemCategory: item.categoryName.trimmingCharacters(in: .whitespacesAndNewlines)
               .caseInsensitiveCompare("System") == .orderedSame,
@@ -701,7 +702,11 @@ struct CanvasTimelineDataView: View {
           // Clear entrance progress for new activities (triggers stagger animation)
           self.cardEntranceProgress = [:]
         }
-        self.positionedActivities = positioned
+        // The 60s silent refresh usually returns identical cards; skip the
+        // reassignment so SwiftUI doesn't rebuild every card view for nothing.
+        if animate || self.positionedActivities != positioned {
+          self.positionedActivities = positioned
+        }
         self.recordingProjection = recordingProjection
         self.hasAnyActivities = !positioned.isEmpty
         if let selectedActivity,
@@ -720,7 +725,7 @@ struct CanvasTimelineDataView: View {
           }
         } else {
           // Silent refresh: ensure all cards are visible immediately (no animation)
-          for activity in positioned {
+          for activity in positioned where self.cardEntranceProgress[activity.id] != true {
             self.cardEntranceProgress[activity.id] = true
           }
         }
@@ -825,15 +830,31 @@ struct CanvasTimelineDataView: View {
     return "\(s) - \(e)"
   }
 
-  private func style(for rawCategory: String) -> CanvasActivityCardStyle {
-    let normalized = rawCategory.trimmingCharacters(in: .whitespacesAndNewlines).lowercased()
-    let categories = categoryStore.categories
-    let matched = categories.first {
-      $0.name.trimmingCharacters(in: .whitespacesAndNewlines).lowercased() == normalized
+  // Built once per cards layer pass so each card is a dictionary lookup instead of
+  // a linear scan over categories plus a hex parse.
+  private func categoryStyleLookup() -> [String: CanvasActivityCardStyle] {
+    var lookup: [String: CanvasActivityCardStyle] = [:]
+    for category in categoryStore.categories {
+      let key = normalizedCategoryKey(category.name)
+      if lookup[key] == nil {
+        lookup[key] = style(for: category)
+      }
+    }
+    return lookup
+  }
+
+  private func style(
+    for rawCategory: String,
+    in lookup: [String: CanvasActivityCardStyle]
+  ) -> CanvasActivityCardStyle {
+    if let matched = lookup[normalizedCategoryKey(rawCategory)] {
+      return matched
     }
-    let fallback = categories.first ?? CategoryPersistence.defaultCategories.first!
-    let category = matched ?? fallback
+    let fallback = categoryStore.categories.first ?? CategoryPersistence.defaultCategories.first!
+    return style(for: fallback)
+  }
 
+  private func style(for category: TimelineCategory) -> CanvasActivityCardStyle {
     let baseNSColor = NSColor(hex: category.colorHex) ?? NSColor(hex: "#4F80EB") ?? .systemBlue
 
     return CanvasActivityCardStyle(
@@ -114,6 +114,7 @@ struct ChatView: View {
       Task { await refreshRuntimeAvailability() }
     }
     .onReceive(Timer.publish(every: 30, on: .main, in: .common).autoconnect()) { _ in
+      guard !hasChatMinimumAccess else { return }
       refreshChatAccessProgress()
     }
     .onDisappear {
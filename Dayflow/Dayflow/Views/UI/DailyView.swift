@@ -71,6 +71,7 @@ struct DailyView: View {
       checkNotificationAuthorizationForUnlock()
     }
     .onReceive(Timer.publish(every: 30, on: .main, in: .common).autoconnect()) { _ in
+      guard !hasDailyMinimumAccess else { return }
       refreshDailyAccessProgress()
     }
     .onReceive(NotificationCenter.default.publisher(for: NSApplication.didBecomeActiveNotification))
@@ -462,9 +462,14 @@ func parseCardMinute(_ value: String) -> Double? {
 }
 
 func normalizedCategoryKey(_ value: String) -> String {
-  value
-    .trimmingCharacters(in: .whitespacesAndNewlines)
-    .lowercased()
+  // Category names rarely carry edge whitespace; skip the Foundation trim copy when they don't.
+  let whitespace = CharacterSet.whitespacesAndNewlines
+  guard let first = value.unicodeScalars.first, let last = value.unicodeScalars.last,
+    !whitespace.contains(first), !whitespace.contains(last)
+  else {
+    return value.trimmingCharacters(in: whitespace).lowercased()
+  }
+  return value.lowercased()
 }
 
 func normalizedHex(_ value: String) -> String {
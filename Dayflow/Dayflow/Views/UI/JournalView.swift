@@ -205,7 +205,7 @@ struct JournalView: View {
     let inputHash = SHA256.hash(data: inputData)
     let inputHashString = inputHash.compactMap { String(format: "%02x", $0) }.joined()
 
-    if inputHashString == requiredCodeHash {
+    if Self.constantTimeEquals(inputHashString, requiredCodeHash) {
       AnalyticsService.shared.capture("journal_unlocked")
       withAnimation(.spring(response: 0.6, dampingFraction: 0.8)) {
         isUnlocked = true
@@ -217,6 +217,20 @@ struct JournalView: View {
       }
     }
   }
+
+  /// Compares every byte instead of exiting early, so timing doesn't leak how much
+  /// of the hash matched.
+  private static func constantTimeEquals(_ lhs: String, _ rhs: String) -> Bool {
+    let lhsBytes = Array(lhs.utf8)
+    let rhsBytes = Array(rhs.utf8)
+    guard lhsBytes.count == rhsBytes.count else { return false }
+
+    var difference: UInt8 = 0
+    for index in lhsBytes.indices {
+      difference |= lhsBytes[index] ^ rhsBytes[index]
+    }
+    return difference == 0
+  }
 }
 
 // MARK: - Journal Onboarding View
@@ -110,24 +110,33 @@ final class OtherSettingsViewModel: ObservableObject {
       var cursor = start
       let endDate = end
 
-      var sections: [String] = []
-      var totalActivities = 0
-      var dayCount = 0
-
+      var days: [(date: Date, dayString: String)] = []
       while cursor <= endDate {
-        let dayString = dayFormatter.string(from: cursor)
-        let cards = StorageManager.shared.fetchTimelineCards(forDay: dayString)
-        totalActivities += cards.count
-        let section = TimelineClipboardFormatter.makeMarkdown(for: cursor, cards: cards)
-        sections.append(section)
-        dayCount += 1
-
+        days.append((cursor, dayFormatter.string(from: cursor)))
         guard let next = calendar.date(byAdding: .day, value: 1, to: cursor) else { break }
         cursor = next
       }
 
+      // One range read for the whole export instead of a query per day.
+      let cardsByDay = StorageManager.shared.fetchTimelineCards(
+        forDays: days.map { $0.dayString })
+
+      // Append straight into one buffer rather than collecting per-day sections
+      // and joining, which held every section twice for long ranges.
       let divider = "\n\n---\n\n"
-      let exportText = sections.joined(separator: divider)
+      var exportText = ""
+      var totalActivities = 0
+      var dayCount = 0
+
+      for day in days {
+        let cards = cardsByDay[day.dayString] ?? []
+        totalActivities += cards.count
+        if dayCount > 0 {
+          exportText += divider
+        }
+        exportText += TimelineClipboardFormatter.makeMarkdown(for: day.date, cards: cards)
+        dayCount += 1
+      }
 
       await MainActor.run {
         self.presentSavePanelAndWrite(
@@ -9,7 +9,7 @@ import Foundation
 import SwiftUI
 
 /// Represents an activity in the timeline view
-struct TimelineActivity: Identifiable {
+struct TimelineActivity: Identifiable, Equatable {
   let id: String
   let recordId: Int64?
   let batchId: Int64?  // Tracks source batch for retry functionality
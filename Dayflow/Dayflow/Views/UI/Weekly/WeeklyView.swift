@@ -72,6 +72,7 @@ struct WeeklyView: View {
       selectDefaultWeekOnEntry()
     }
     .onReceive(Timer.publish(every: 30, on: .main, in: .common).autoconnect()) { _ in
+      guard !weeklyAccessProgress.isComplete else { return }
       refreshWeeklyAccessState()
     }
     .onChange(of: scenePhase) { _, phase in
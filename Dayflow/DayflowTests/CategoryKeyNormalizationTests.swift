@@ -0,0 +1,22 @@
+import XCTest
+
+@testable import Dayflow
+
+final class CategoryKeyNormalizationTests: XCTestCase {
+  func testCleanKeyIsLowercased() {
+    XCTAssertEqual(normalizedCategoryKey("Work"), "work")
+    XCTAssertEqual(normalizedCategoryKey("deep work"), "deep work")
+  }
+
+  func testEdgeWhitespaceIsTrimmed() {
+    XCTAssertEqual(normalizedCategoryKey("  Work"), "work")
+    XCTAssertEqual(normalizedCategoryKey("Work \n"), "work")
+    XCTAssertEqual(normalizedCategoryKey("\tDeep Work\t"), "deep work")
+  }
+
+  func testWhitespaceOnlyAndEmptyInputNormalizeToEmpty() {
+    XCTAssertEqual(normalizedCategoryKey("\n"), "")
+    XCTAssertEqual(normalizedCategoryKey("  \n  "), "")
+    XCTAssertEqual(normalizedCategoryKey(""), "")
+  }
+}
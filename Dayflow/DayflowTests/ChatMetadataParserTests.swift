@@ -0,0 +1,46 @@
+import XCTest
+
+@testable import Dayflow
+
+final class ChatMetadataParserTests: XCTestCase {
+  func testStripsResidualHeadingLines() {
+    let text = """
+      Here is your answer.
+      ## Suggestions
+      First body line
+      ### Memory
+      Second body line
+      Suggestions:
+      Memory:
+      Done.
+      """
+
+    XCTAssertEqual(
+      contentLines(ChatMetadataParser.stripResidualMetadataHeadings(from: text)),
+      ["Here is your answer.", "First body line", "Second body line", "Done."]
+    )
+  }
+
+  func testKeepsBodyLinesThatMentionHeadingWords() {
+    let text = """
+      Your Suggestions are listed below.
+      The Memory: section keeps preferences.
+      ## Suggestions for tomorrow
+      """
+
+    XCTAssertEqual(
+      contentLines(ChatMetadataParser.stripResidualMetadataHeadings(from: text)),
+      [
+        "Your Suggestions are listed below.",
+        "The Memory: section keeps preferences.",
+        "## Suggestions for tomorrow",
+      ]
+    )
+  }
+
+  private func contentLines(_ text: String) -> [String] {
+    text.components(separatedBy: .newlines)
+      .map { $0.trimmingCharacters(in: .whitespaces) }
+      .filter { !$0.isEmpty }
+  }
+}
@@ -7,6 +7,13 @@ final class TimeParsingTests: XCTestCase {
         XCTAssertEqual(parseTimeHMMA(timeString: "11:59 PM"), 23 * 60 + 59)
     }
 
+    func testCompactAndBoundaryTimes() {
+        XCTAssertEqual(parseTimeHMMA(timeString: "9:30am"), 9 * 60 + 30)
+        XCTAssertEqual(parseTimeHMMA(timeString: " 09:05PM "), 21 * 60 + 5)
+        XCTAssertEqual(parseTimeHMMA(timeString: "12:00 AM"), 0)
+        XCTAssertEqual(parseTimeHMMA(timeString: "12:15 PM"), 12 * 60 + 15)
+    }
+
     func testInvalidTimes() {
         XCTAssertNil(parseTimeHMMA(timeString: ""))
         XCTAssertNil(parseTimeHMMA(timeString: "invalid"))